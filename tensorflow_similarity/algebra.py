@@ -42,9 +42,15 @@ def masked_max(distances: FloatTensor, mask: BoolTensor, dim: int = 1) -> tuple[
     mask = tf.cast(mask, dtype=tf.float64)
 
     axis_min = tf.math.reduce_min(distances, dim, keepdims=True) - 1e-6
-    masked_max = tf.math.multiply(distances - axis_min, mask)
-    arg_max = tf.math.argmax(masked_max, dim)
-    masked_max = tf.math.reduce_max(masked_max, dim, keepdims=True) + axis_min
+    masked = tf.math.multiply(distances - axis_min, mask)
+    arg_max = tf.math.argmax(masked, dim)
+    if dim == 1:
+        # Read the max values back through the argmax indices so the matrix
+        # is only scanned once instead of running a second full reduction.
+        masked_max = tf.gather(masked, arg_max[:, tf.newaxis], axis=1, batch_dims=1)
+    else:
+        masked_max = tf.math.reduce_max(masked, dim, keepdims=True)
+    masked_max = masked_max + axis_min
     return tf.cast(masked_max, dtype=distance_dtype), arg_max
 
 
@@ -66,14 +72,24 @@ def masked_min(distances: FloatTensor, mask: BoolTensor, dim: int = 1) -> tuple[
     mask = tf.cast(mask, dtype=tf.float64)
 
     axis_max = tf.math.reduce_max(distances, dim, keepdims=True) + 1e-6
-    masked_min = tf.math.multiply(distances - axis_max, mask)
-    arg_min = tf.math.argmin(masked_min, dim)
-    masked_min = tf.math.reduce_min(masked_min, dim, keepdims=True) + axis_max
+    masked = tf.math.multiply(distances - axis_max, mask)
+    arg_min = tf.math.argmin(masked, dim)
+    if dim == 1:
+        # Read the min values back through the argmin indices so the matrix
+        # is only scanned once instead of running a second full reduction.
+        masked_min = tf.gather(masked, arg_min[:, tf.newaxis], axis=1, batch_dims=1)
+    else:
+        masked_min = tf.math.reduce_min(masked, dim, keepdims=True)
+    masked_min = masked_min + axis_max
     return tf.cast(masked_min, dtype=distance_dtype), arg_min
 
 
 def build_masks(
-    query_labels: IntTensor, key_labels: IntTensor, batch_size: int, remove_diagonal: bool = True
+    query_labels: IntTensor,
+    key_labels: IntTensor,
+    batch_size: int,
+    remove_diagonal: bool = True,
+    num_classes: int | None = None,
 ) -> tuple[BoolTensor, BoolTensor]:
     """Build masks that allows to select only the positive or negatives
     embeddings.
@@ -82,18 +98,43 @@ def build_masks(
         key_labels: 1D int `Tensor` that contains the key class ids.
         batch_size: size of the batch.
         remove_diagonal: Bool. If True, will set diagonal to False in positive pair mask
+        num_classes: Optional static number of classes. When given and small
+            compared to the batch size, the positive mask is computed as a
+            product of [batch_size, num_classes] one-hot matrices, a single
+            small matmul, instead of broadcasting an integer equality over
+            the full [batch_size, batch_size] matrix. Labels must lie in
+            [0, num_classes).
 
     Returns:
         Tuple of Tensors containing the positive_mask and negative_mask
     """
-    if tf.rank(query_labels) == 1:
+    # Specialize the common symmetric case where the queries and the keys
+    # are the same tensor so the labels are only reshaped once and the
+    # symmetric subgraph is shared.
+    symmetric = key_labels is query_labels
+
+    # Use the static rank here so no cond op is added to the graph. This
+    # keeps the mask construction compatible with XLA compilation.
+    if query_labels.shape.rank == 1:
         query_labels = tf.reshape(query_labels, (-1, 1))
 
-    if tf.rank(key_labels) == 1:
+    if symmetric:
+        key_labels = query_labels
+    elif key_labels.shape.rank == 1:
         key_labels = tf.reshape(key_labels, (-1, 1))
 
     # same class mask
-    positive_mask = tf.math.equal(query_labels, tf.transpose(key_labels))
+    if num_classes is not None:
+        # Classes-dense path: one_hot_q @ one_hot_k^T is 1.0 exactly where
+        # the class ids match, so the threshold recovers the boolean mask.
+        oh_query = tf.one_hot(tf.reshape(query_labels, [-1]), num_classes, dtype=tf.keras.backend.floatx())
+        if symmetric:
+            oh_key = oh_query
+        else:
+            oh_key = tf.one_hot(tf.reshape(key_labels, [-1]), num_classes, dtype=tf.keras.backend.floatx())
+        positive_mask = tf.linalg.matmul(oh_query, oh_key, transpose_b=True) > 0.5
+    else:
+        positive_mask = tf.math.equal(query_labels, tf.transpose(key_labels))
 
     # not the same class
     negative_mask = tf.math.logical_not(positive_mask)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -336,24 +335,24 @@ class BaseIndexer(ABC):
                 desc="matching embeddings",
             )
 
-        matches: defaultdict[str, list[int]] = defaultdict(list)
-        for cp_name, cp_data in self.cutpoints.items():
-            distance_threshold = float(cp_data["distance"])
+        # The derived matches only depend on the lookups, not on the cutpoint,
+        # so derive them once before iterating the cutpoint thresholds.
+        pred_labels, pred_dist = matcher.derive_match(lookup_labels=lookup_labels, lookup_distances=lookup_distances)
 
-            pred_labels, pred_dist = matcher.derive_match(
-                lookup_labels=lookup_labels, lookup_distances=lookup_distances
-            )
+        # Each cutpoint is a single vectorized thresholding over the derived
+        # matches instead of a Python level comparison per embedding.
+        pred_labels_np = np.asarray(pred_labels).reshape(-1)
+        pred_dist_np = np.asarray(pred_dist).reshape(-1)
 
-            for label, distance in zip(pred_labels, pred_dist):
-                if distance <= distance_threshold:
-                    label = int(label)
-                else:
-                    label = no_match_label
+        matches: dict[str, list[int]] = {}
+        for cp_name, cp_data in self.cutpoints.items():
+            distance_threshold = float(cp_data["distance"])
 
-                matches[cp_name].append(label)
+            cp_matches = np.where(pred_dist_np <= distance_threshold, pred_labels_np, no_match_label)
+            matches[cp_name] = cp_matches.tolist()
 
-                if verbose:
-                    pb.update()
+            if verbose:
+                pb.update(len(pred_dist_np))
 
         if verbose:
             pb.close()
@@ -26,6 +26,9 @@ class Distance(ABC):
 
     def __init__(self, name: str, **kwargs):
         self.name = name
+        # Bind the subclass call method once so that __call__ skips the
+        # per-batch descriptor lookup on the tf.function wrapped method.
+        self._distance_call = self.call
 
     @abstractmethod
     def call(self, query_embeddings: FloatTensor, key_embeddings: FloatTensor) -> FloatTensor:
@@ -40,7 +43,7 @@ class Distance(ABC):
         """
 
     def __call__(self, query_embeddings: FloatTensor, key_embeddings: FloatTensor):
-        return self.call(query_embeddings, key_embeddings)
+        return self._distance_call(query_embeddings, key_embeddings)
 
     def __str__(self) -> str:
         return self.name
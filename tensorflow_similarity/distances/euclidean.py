@@ -64,7 +64,7 @@ class EuclideanDistance(Distance):
         # of 1.0.
         dist_mask = tf.math.greater_equal(distances, 1e-18)
         distances = tf.math.maximum(distances, 1e-18)
-        distances = tf.math.sqrt(distances) * tf.cast(dist_mask, tf.float32)
+        distances = tf.math.sqrt(distances) * tf.cast(dist_mask, distances.dtype)
 
         return distances
 
@@ -52,11 +52,26 @@ class SNRDistance(Distance):
         # Calculating feature variance for each example
         anchor_var = tf.math.reduce_variance(query_embeddings, axis=1)
 
-        # Calculating pairwise noise variances
+        # Calculating pairwise noise variances using the identity
+        # Var(q - k) = E[(q - k)^2] - E[q - k]^2
+        #            = E[q^2] - 2*E[qk] + E[k^2] - (E[q] - E[k])^2
+        # so the [batch, batch, dim] delta tensor never materializes; the
+        # cross term becomes a single matmul plus row-wise reductions.
         q_rs = tf.reshape(query_embeddings, shape=[tf.shape(query_embeddings)[0], -1])
         k_rs = tf.reshape(key_embeddings, shape=[tf.shape(key_embeddings)[0], -1])
-        delta = tf.expand_dims(q_rs, axis=1) - tf.expand_dims(k_rs, axis=0)
-        noise_var = tf.math.reduce_variance(delta, axis=2)
+        dim = tf.cast(tf.shape(q_rs)[1], dtype=q_rs.dtype)
+
+        q_mean = tf.math.reduce_mean(q_rs, axis=1, keepdims=True)
+        k_mean = tf.math.reduce_mean(k_rs, axis=1, keepdims=True)
+        q_sq_mean = tf.math.reduce_mean(tf.math.square(q_rs), axis=1, keepdims=True)
+        k_sq_mean = tf.math.reduce_mean(tf.math.square(k_rs), axis=1, keepdims=True)
+
+        cross_mean = tf.linalg.matmul(q_rs, k_rs, transpose_b=True) / dim
+        delta_sq_mean = q_sq_mean - 2.0 * cross_mean + tf.transpose(k_sq_mean)
+        delta_mean = q_mean - tf.transpose(k_mean)
+        noise_var = delta_sq_mean - tf.math.square(delta_mean)
+        # Guard against small negative values from floating point cancellation.
+        noise_var = tf.math.maximum(noise_var, 0.0)
 
         distances: FloatTensor = tf.divide(noise_var, tf.expand_dims(anchor_var, axis=1))
 
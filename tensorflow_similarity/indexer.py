@@ -17,10 +17,12 @@ sub-linear search"""
 from __future__ import annotations
 
 import json
+import os
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import tensorflow as tf
@@ -343,13 +345,36 @@ class Indexer(BaseIndexer):
 
         return batch_lookups
 
-    def save(self, path: Path | str, compression: bool = True, overwrite: bool = True):
+    def save(
+        self,
+        path: Path | str,
+        compression: bool | str = True,
+        overwrite: bool = True,
+        io_threads: int = 0,
+        num_shards: int = 1,
+        direct_io: bool = False,
+        quantize: str = "none",
+    ):
         """Save the index to disk
 
         Args:
             path: directory where to save the index
             compression: Store index data compressed. Defaults to True.
+            Pass "zstd" to use zstandard frame compression instead of the
+            zipfile default (requires the optional zstandard package).
             overwrite: Overwrite previous index. Defaults to True.
+            io_threads: Number of threads used to write the index artifacts.
+            The metadata, the key value store and the search index are
+            independent files, so compressing and serializing them can
+            overlap. Values below 2 keep the writes sequential. Defaults
+            to 0.
+            num_shards: When above 1, partition the key value store records
+            by row range and write the shards in parallel. Defaults to 1.
+            direct_io: Write the key value store through raw file
+            descriptors and drop the written pages from the page cache.
+            Local filesystems only. Defaults to False.
+            quantize: Store the embeddings at reduced precision, "int8" or
+            "fp16". Defaults to "none" (full precision).
         """
         path = Path(path)
 
@@ -375,12 +400,32 @@ class Indexer(BaseIndexer):
         }
 
         metadata_fname = self.__make_metadata_fname(str(path))
-        tf.io.write_file(metadata_fname, json.dumps(metadata))
 
         (path / "store").mkdir(parents=True)
         (path / "search").mkdir(parents=True)
-        self.kv_store.save(path / "store", compression=compression)
-        self.search.save(path / "search")
+
+        # only forward the optional knobs when set: not every store supports
+        # sharded export or direct io.
+        store_kwargs: dict[str, Any] = {}
+        if num_shards > 1:
+            store_kwargs["num_shards"] = num_shards
+        if direct_io:
+            store_kwargs["direct_io"] = direct_io
+        if quantize != "none":
+            store_kwargs["quantize"] = quantize
+        jobs = (
+            lambda: tf.io.write_file(metadata_fname, json.dumps(metadata)),
+            lambda: self.kv_store.save(path / "store", compression=compression, **store_kwargs),
+            lambda: self.search.save(path / "search"),
+        )
+        if io_threads > 1:
+            with ThreadPoolExecutor(max_workers=min(io_threads, len(jobs))) as executor:
+                # resolve the futures to surface any write error.
+                for future in [executor.submit(job) for job in jobs]:
+                    future.result()
+        else:
+            for job in jobs:
+                job()
 
     @staticmethod
     def load(path: Path | str, verbose: int = 1):
@@ -395,6 +440,23 @@ class Indexer(BaseIndexer):
             Initialized index
         """
         path = str(path)
+
+        # ask the kernel to start paging the index files in now, so the
+        # reads below find the data already in the page cache while the
+        # metadata parsing and structure rebuilds run.
+        if hasattr(os, "posix_fadvise") and os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for file in files:
+                    try:
+                        fd = os.open(os.path.join(root, file), os.O_RDONLY)
+                        try:
+                            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                        finally:
+                            os.close(fd)
+                    except OSError:
+                        # non-local or unreadable file: the hint is best effort.
+                        pass
+
         # recreate the index from metadata
         metadata_fname = Indexer.__make_metadata_fname(path)
         metadata = tf.io.read_file(metadata_fname)
@@ -493,17 +555,35 @@ class Indexer(BaseIndexer):
             rows.append([k, v])
         print(tabulate(rows))
 
-    def to_data_frame(self, num_items: int = 0) -> PandasDataFrame:
+    def to_data_frame(self, num_items: int = 0, chunk_size: int = 0) -> PandasDataFrame:
         """Export data as pandas dataframe
 
         Args:
             num_items (int, optional): Num items to export to the dataframe.
             Defaults to 0 (unlimited).
 
+            chunk_size (int, optional): When set, stream the records as a
+            generator of `(start, end, dataframe)` tuples of at most
+            `chunk_size` rows each instead of materializing a single
+            dataframe. Defaults to 0 (single dataframe).
+
+        Returns:
+            pd.DataFrame: a pandas dataframe, or a generator of
+            `(start, end, pd.DataFrame)` tuples when `chunk_size` is set.
+        """
+        return self.kv_store.to_data_frame(num_items, chunk_size=chunk_size)
+
+    def to_arrow_table(self, num_items: int = 0):
+        """Export data as a pyarrow Table without going through pandas.
+
+        Args:
+            num_items (int, optional): Num items to export to the table.
+            Defaults to 0 (unlimited).
+
         Returns:
-            pd.DataFrame: a pandas dataframe.
+            pa.Table: a pyarrow table.
         """
-        return self.kv_store.to_data_frame(num_items)
+        return self.kv_store.to_arrow_table(num_items)
 
     @staticmethod
     def __make_metadata_fname(path):
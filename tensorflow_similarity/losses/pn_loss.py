@@ -19,12 +19,13 @@
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, cast
 
 import tensorflow as tf
 
 if TYPE_CHECKING:
-    from ..types import FloatTensor, IntTensor
+    from ..types import BoolTensor, FloatTensor, IntTensor
     from ..distances import Distance
 
 from .. import distances
@@ -32,6 +33,36 @@ from ..algebra import build_masks
 from .metric_loss import MetricLoss
 from .utils import compute_loss, negative_distances, positive_distances
 
+# Small memo for build_masks keyed on the identity of the label tensors.
+# The masks only depend on the labels, so when the same label tensors are
+# passed in repeatedly, e.g. several losses or metrics sharing a batch, the
+# boolean [batch_size, batch_size] masks are reused instead of rebuilt.
+_MASKS_CACHE_SIZE = 8
+_masks_cache: OrderedDict = OrderedDict()
+
+
+def _build_masks_cached(
+    query_labels: IntTensor,
+    key_labels: IntTensor,
+    batch_size: int,
+    remove_diagonal: bool = True,
+) -> tuple[BoolTensor, BoolTensor]:
+    """Memoized build_masks keyed on the label tensors identity."""
+    cache_key = (query_labels.ref(), key_labels.ref(), remove_diagonal)
+    masks = _masks_cache.get(cache_key)
+    if masks is None:
+        masks = build_masks(
+            query_labels,
+            key_labels,
+            batch_size=batch_size,
+            remove_diagonal=remove_diagonal,
+        )
+        _masks_cache[cache_key] = masks
+        if len(_masks_cache) > _MASKS_CACHE_SIZE:
+            _masks_cache.popitem(last=False)
+
+    return masks
+
 
 def pn_loss(
     query_labels: IntTensor,
@@ -43,6 +74,7 @@ def pn_loss(
     positive_mining_strategy: str = "hard",
     negative_mining_strategy: str = "semi-hard",
     margin: float | None = None,
+    apply_pn_swap: bool = True,
 ) -> Any:
     """Positive Negative loss computations.
 
@@ -67,6 +99,11 @@ def pn_loss(
             A soft margin can be beneficial to pull together samples from the
             same class as much as possible. See the paper for more details
             https://arxiv.org/pdf/1703.07737.pdf. Defaults to None.
+        apply_pn_swap: If True, tighten the negative distance with the
+            distance between the mined positive and negative examples, as in
+            the IVIS paper. Set to False to use the anchor to negative
+            distance directly and skip the cross-term gather. Defaults to
+            True.
 
     Returns:
         Loss: The loss value for the current batch.
@@ -77,13 +114,31 @@ def pn_loss(
     # do not remove this code. It is actually needed for specific situation
     # Reshape label tensor to [batch_size, 1] if not already in that format.
     # labels = tf.reshape(labels, (labels.shape[0], 1))
-    batch_size = tf.size(query_labels)
+    # Prefer the static batch size: a Python int avoids the host sync on the
+    # tensor value and gives XLA a compile time constant shape. Only fall
+    # back to the dynamic shape op when the batch dim is unknown.
+    batch_size = query_labels.shape[0]
+    if batch_size is None:
+        batch_size = tf.shape(query_labels)[0]
 
     # [distances]
+    # The distance functions return a row-major [batch_query, batch_key]
+    # matrix (NT matmul, queries on the leading axis), and all the mining
+    # reductions below run along axis=1, so every reduction and gather
+    # walks contiguous rows.
+    # Under a mixed precision policy, compute the pairwise distances in the
+    # policy compute dtype (e.g. bfloat16). The matmul based distances
+    # accumulate in float32 while halving the memory traffic on the
+    # embedding matrices. Mining and loss computation stay in full precision.
+    compute_dtype = tf.keras.mixed_precision.global_policy().compute_dtype
+    if compute_dtype in ("float16", "bfloat16"):
+        query_embeddings = tf.cast(query_embeddings, compute_dtype)
+        key_embeddings = tf.cast(key_embeddings, compute_dtype)
     pairwise_distances = distance(query_embeddings, key_embeddings)
+    pairwise_distances = tf.cast(pairwise_distances, tf.keras.backend.floatx())
 
     # [masks]
-    positive_mask, negative_mask = build_masks(
+    positive_mask, negative_mask = _build_masks_cached(
         query_labels,
         key_labels,
         batch_size=batch_size,
@@ -98,21 +153,31 @@ def pn_loss(
     )
 
     # [Negative distances computation]
+    # Hard positive mining already reduced the positive columns, so reuse its
+    # output as the semi-hard threshold instead of reducing a second time.
+    max_positive = pos_distances if positive_mining_strategy == "hard" else None
     neg_distances, neg_idxs = negative_distances(
         negative_mining_strategy,
         pairwise_distances,
         negative_mask,
         positive_mask,
+        max_positive=max_positive,
     )
 
-    # Compute the distance between the pairs of positive and negative examples.
-    # Then take the min(pos_neg_dist, anchor_neg_dist) as the neg_distances.
-    # This encourages both the anchor and the positives to be far from the
-    # negative.
-    pn_pairs = tf.stack([pos_idxs, neg_idxs], axis=1)
-    pn_distances = tf.gather_nd(pairwise_distances, pn_pairs)
-    pn_distances = tf.reshape(pn_distances, [-1, 1])
-    neg_distances = tf.math.minimum(pn_distances, neg_distances)
+    if apply_pn_swap:
+        # Compute the distance between the pairs of positive and negative
+        # examples. Then take the min(pos_neg_dist, anchor_neg_dist) as the
+        # neg_distances. This encourages both the anchor and the positives
+        # to be far from the negative.
+        # Index the flattened matrix directly so only the batch_size
+        # cross-term elements are read; gathering the positive rows first
+        # would materialize a [batch_size, batch_size] intermediate, with
+        # duplicated rows whenever several anchors share a positive.
+        num_cols = tf.cast(tf.shape(pairwise_distances)[1], dtype=pos_idxs.dtype)
+        pn_idxs = pos_idxs * num_cols + neg_idxs
+        flat_distances = tf.reshape(pairwise_distances, [-1])
+        pn_distances = tf.gather(flat_distances, pn_idxs[:, tf.newaxis])
+        neg_distances = tf.math.minimum(pn_distances, neg_distances)
 
     # [PN loss computation]
     pn_loss = compute_loss(pos_distances, neg_distances, margin)
@@ -153,6 +218,7 @@ class PNLoss(MetricLoss):
         positive_mining_strategy: str = "hard",
         negative_mining_strategy: str = "semi-hard",
         margin: float | None = None,
+        apply_pn_swap: bool = True,
         name: str = "pn_loss",
         **kwargs,
     ):
@@ -171,6 +237,11 @@ class PNLoss(MetricLoss):
                 A soft margin can be beneficial to pull together samples from the
                 same class as much as possible. See the paper for more details
                 https://arxiv.org/pdf/1703.07737.pdf. Defaults to None.
+            apply_pn_swap: If True, tighten the negative distance with the
+                distance between the mined positive and negative examples, as
+                in the IVIS paper. Set to False to use the anchor to negative
+                distance directly and skip the cross-term gather. Defaults to
+                True.
             name: Optional name for the instance. Defaults to 'pn_loss'.
 
         Raises:
@@ -187,13 +258,74 @@ class PNLoss(MetricLoss):
         if negative_mining_strategy not in ["easy", "hard", "semi-hard"]:
             raise ValueError("Invalid negative mining strategy.")
 
+        # Keep margin a Python float so the soft vs fixed margin branch in
+        # compute_loss is decided at trace time and the margin value is
+        # constant folded by XLA instead of read at runtime.
+        if margin is not None:
+            margin = float(margin)
+
+        # Compile the loss with XLA so the distance, mining, and loss ops are
+        # fused into a few kernels instead of dispatched individually. The
+        # loss is memory bound on the [batch_size, batch_size] distance
+        # matrix, so fusing the elementwise ops cuts the intermediate memory
+        # traffic. reduce_retracing limits retracing to one graph per shape
+        # class when the batch shape varies.
+        xla_pn_loss = tf.function(pn_loss, jit_compile=True, reduce_retracing=True)
+
         super().__init__(
-            pn_loss,
+            xla_pn_loss,
             name=name,
             # The following are passed to the circle_loss function as fn_kwargs
             distance=self.distance,
             positive_mining_strategy=positive_mining_strategy,
             negative_mining_strategy=negative_mining_strategy,
             margin=margin,
+            apply_pn_swap=apply_pn_swap,
             **kwargs,
         )
+
+    def build(
+        self,
+        batch_size: int,
+        embedding_size: int,
+        embedding_dtype: Any = None,
+        label_dtype: Any = None,
+    ) -> Any:
+        """Ahead-of-time compile the loss for a fixed batch shape.
+
+        Traces and XLA-compiles the wrapped loss function for the given
+        static batch and embedding shape. Subsequent loss calls with
+        matching shapes and dtypes reuse the compiled graph, so neither
+        tracing nor XLA compilation happens inside the first training step.
+        Calling this is optional; dynamic shapes keep working through the
+        regular retracing path.
+
+        Args:
+            batch_size: Static batch size to compile for.
+            embedding_size: Dimension of the embedding vectors.
+            embedding_dtype: dtype of the embeddings. Defaults to floatx().
+            label_dtype: dtype of the labels as seen by the loss function.
+                Keras casts y_true to the prediction dtype before calling
+                the loss, so this defaults to floatx() as well.
+
+        Returns:
+            The ConcreteFunction compiled for the requested shapes.
+        """
+        if embedding_dtype is None:
+            embedding_dtype = tf.keras.backend.floatx()
+        if label_dtype is None:
+            label_dtype = tf.keras.backend.floatx()
+
+        label_spec = tf.TensorSpec(shape=[batch_size], dtype=label_dtype)
+        embedding_spec = tf.TensorSpec(shape=[batch_size, embedding_size], dtype=embedding_dtype)
+
+        # self.fn is declared as a plain Callable on the wrapper, but it is
+        # always the tf.function built in __init__.
+        fn = cast(Any, self.fn)
+        return fn.get_concrete_function(
+            label_spec,
+            embedding_spec,
+            label_spec,
+            embedding_spec,
+            **self._fn_kwargs,
+        )
@@ -58,6 +58,7 @@ def negative_distances(
     distances: FloatTensor,
     negative_mask: BoolTensor,
     positive_mask: BoolTensor,
+    max_positive: FloatTensor | None = None,
 ) -> tuple[FloatTensor, FloatTensor]:
     """Negative distance computation.
 
@@ -74,6 +75,11 @@ def negative_distances(
 
         batch_size: The current batch size.
 
+        max_positive: Optional [n, 1] float `Tensor` of precomputed maximal
+        positive distances, e.g. the output of hard positive mining. Passing
+        it avoids a second reduction over the positive mask during semi-hard
+        mining.
+
     Raises:
         ValueError: Invalid negative mining strategy
 
@@ -91,16 +97,23 @@ def negative_distances(
         # distance, as in the easy case.
 
         # find max value of positive distance
-        max_positive, _ = masked_max(distances, positive_mask)
+        if max_positive is None:
+            max_positive, _ = masked_max(distances, positive_mask)
 
         # select distance that are above the max positive distance
         greater_distances = tf.math.greater(distances, max_positive)
 
         # combine greater_distances with negative mask: keep negative
         # value if greater, otherwise set to value from easy mask.
+        # Expressed with elementwise logical ops rather than a tf.where
+        # select so the combine fuses into the masked reduction without a
+        # predicated select path.
         _, max_neg_idxs = masked_max(distances, negative_mask)
         easy_mask = semi_hard_easy_mask(distances, max_neg_idxs)
-        semi_hard_mask = tf.where(greater_distances, negative_mask, easy_mask)
+        semi_hard_mask = tf.math.logical_or(
+            tf.math.logical_and(greater_distances, negative_mask),
+            tf.math.logical_and(tf.math.logical_not(greater_distances), easy_mask),
+        )
 
         # find the  minimal distance between negative labels above threshold
         negative_distances, neg_idxs = masked_min(distances, semi_hard_mask)
@@ -142,6 +155,7 @@ def semi_hard_easy_mask(
     return easy_mask
 
 
+@tf.function(jit_compile=True, autograph=False, reduce_retracing=True)
 def compute_loss(
     positive_distances: FloatTensor,
     negative_distances: FloatTensor,
@@ -158,11 +172,19 @@ def compute_loss(
 
     Returns:
         An [n,1] FloatTensor containing the loss for each example.
+
+    Notes:
+        margin must be a Python scalar (or None), never a tensor, so that
+        the soft vs fixed margin branch is resolved at trace time and the
+        margin constant folds into the compiled graph.
     """
     loss = tf.math.subtract(positive_distances, negative_distances)
 
     if margin is None:
-        loss = logsumexp(loss, tf.ones_like(loss))
+        # Softplus is the numerically stable log(1 + e^x) primitive; over
+        # an [n,1] input it is exactly the masked logsumexp previously used
+        # here, but lowers to a single fused elementwise kernel.
+        loss = tf.math.softplus(loss)
     else:
         loss = tf.math.add(loss, margin)
         loss = tf.maximum(loss, 0.0)  # numeric stability
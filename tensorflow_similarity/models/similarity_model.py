@@ -40,10 +40,15 @@ history = model.fit(train_ds)
 """
 from __future__ import annotations
 
-from collections import defaultdict
+import hashlib
+import inspect
+import json
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 import numpy as np
 import tensorflow as tf
@@ -54,6 +59,48 @@ from .. import distances
 from ..classification_metrics import make_classification_metric
 from ..indexer import Indexer
 
+logger = logging.getLogger(__name__)
+
+# Whether tf.keras.Model.compile accepts steps_per_execution. Probed once at
+# import time: graph-mode keras (training_v1) does not support the arg, and
+# checking the signature here avoids branching on eager state in compile().
+_COMPILE_SUPPORTS_SPE = "steps_per_execution" in inspect.signature(tf.keras.Model.compile).parameters
+
+# Pre-built "index not saved" diagnostics keyed on (has_ix, save_index) so
+# the per-checkpoint save() path never concatenates strings.
+_NO_INDEX_MSG = (
+    "The model does not currently have an index. To use indexing "
+    "you must call either model.compile() or model.create_index() "
+    "and set a valid Distance."
+)
+# Prebuilt kwargs for the common all-defaults Keras save call so per-epoch
+# checkpointing does not rebuild the same dict every time.
+_DEFAULT_SAVE_KWARGS: dict[str, Any] = {
+    "overwrite": True,
+    "include_optimizer": True,
+    "save_format": None,
+    "signatures": None,
+    "options": None,
+    "save_traces": True,
+}
+_INDEX_NOT_SAVED_MSGS = {
+    (True, True): "The index was not saved with the model.",
+    (True, False): "The index was not saved with the model. The save_index param is set to False.",
+    (False, True): "The index was not saved with the model." + _NO_INDEX_MSG,
+    (False, False): (
+        "The index was not saved with the model." + _NO_INDEX_MSG + " The save_index param is set to False."
+    ),
+}
+
+# Reduced precision dtypes accepted for the inference only embedding
+# extraction. Keys mirror the tf.keras.mixed_precision policy names.
+_EMBEDDING_PRECISION_DTYPES = {
+    "mixed_float16": tf.float16,
+    "float16": tf.float16,
+    "mixed_bfloat16": tf.bfloat16,
+    "bfloat16": tf.bfloat16,
+}
+
 if TYPE_CHECKING:
     from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
 
@@ -92,6 +139,18 @@ class SimilarityModel(tf.keras.Model):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._predict_batch_size: int = 256
+        self._predict_steps_per_execution: int = 1
+        self._predict_use_xla: bool = True
+        self._embedding_precision: str | None = None
+        self._predict_cache_size: int = 0
+        self._predict_cache: OrderedDict = OrderedDict()
+        self._predict_fn = None
+        self._predict_steps_fn = None
+        self._single_predict_fn = None
+        self._last_save_sig: str | None = None
+        self._last_save_path: str | None = None
+        self._last_index_sig: tuple | None = None
 
     def compile(
         self,
@@ -108,6 +167,11 @@ class SimilarityModel(tf.keras.Model):
         search: Search | str = "linear",
         evaluator: Evaluator | str = "memory",
         stat_buffer_size: int = 1000,
+        predict_batch_size: int = 256,
+        predict_steps_per_execution: int | None = None,
+        use_xla: bool = True,
+        embedding_precision: str | None = None,
+        predict_cache_size: int = 0,
         **kwargs,
     ):
         """Configures the model for training.
@@ -196,6 +260,38 @@ class SimilarityModel(tf.keras.Model):
             stat_buffer_size: Size of the sliding windows buffer used to compute
               index performance. Defaults to 1000.
 
+            predict_batch_size: Batch size used when computing embeddings for
+              indexing, lookup, calibration and evaluation. Inference has a much
+              smaller memory footprint than training so a larger batch size
+              amortizes the per-batch dispatch overhead. Defaults to 256.
+
+            predict_steps_per_execution: Number of inference batches to run
+              per `tf.function` call when computing embeddings, akin to
+              `steps_per_execution` for training. Defaults to None which
+              reuses the `steps_per_execution` value.
+
+            use_xla: If True, the cached inference functions used for
+              embedding extraction are compiled with XLA, fusing the forward
+              pass into fewer kernels. Compilation adds a one time warmup
+              cost per input shape; set to False for models with ops XLA
+              cannot compile. Defaults to True.
+
+            embedding_precision: One of 'mixed_float16', 'float16',
+              'mixed_bfloat16' or 'bfloat16'. When set, inputs to the cached
+              inference functions are cast to the reduced precision dtype and
+              the embeddings are cast back to the Keras float type before
+              being handed to the index. This halves the inference memory
+              traffic for models built under the matching
+              `tf.keras.mixed_precision` policy at the cost of some embedding
+              accuracy. Defaults to None which keeps full precision.
+
+            predict_cache_size: Number of embedding arrays kept in a small
+              LRU cache keyed on the identity, shape and dtype of the input,
+              so back-to-back evaluations over the same array (e.g.
+              `evaluate_retrieval` followed by `evaluate_classification`)
+              skip the second forward pass. The caller must not mutate the
+              cached inputs in place. Defaults to 0 which disables caching.
+
         Raises:
             ValueError: In case of invalid arguments for
                 `optimizer`, `loss` or `metrics`.
@@ -213,10 +309,30 @@ class SimilarityModel(tf.keras.Model):
                     msg = "distance='auto' only works if the first loss is a " "metric loss"
                     raise ValueError(msg)
 
-            print(f"Distance metric automatically set to {distance} use the " "distance arg to override.")
+            logger.info("Distance metric automatically set to %s use the distance arg to override.", distance)
         else:
             distance = distances.get(distance)
 
+        # config for the embedding extraction used by the indexing and
+        # evaluation methods. The forward pass is re-wrapped on (re)compile as
+        # the model graph may have changed.
+        self._predict_batch_size = predict_batch_size
+        if predict_steps_per_execution is None:
+            predict_steps_per_execution = steps_per_execution
+        self._predict_steps_per_execution = predict_steps_per_execution
+        self._predict_use_xla = use_xla
+        if embedding_precision is not None and embedding_precision not in _EMBEDDING_PRECISION_DTYPES:
+            raise ValueError(
+                f"Unknown embedding_precision: {embedding_precision}. "
+                f"Expected one of {sorted(_EMBEDDING_PRECISION_DTYPES)} or None."
+            )
+        self._embedding_precision = embedding_precision
+        self._predict_cache_size = predict_cache_size
+        self._predict_cache = OrderedDict()
+        self._predict_fn = None
+        self._predict_steps_fn = None
+        self._single_predict_fn = None
+
         # init index
         self.create_index(
             distance=distance,
@@ -228,33 +344,25 @@ class SimilarityModel(tf.keras.Model):
         )
 
         # call underlying keras method
-        if tf.executing_eagerly():
-            super().compile(
-                optimizer=optimizer,
-                loss=loss,
-                metrics=metrics,
-                loss_weights=loss_weights,
-                weighted_metrics=weighted_metrics,
-                run_eagerly=run_eagerly,
-                steps_per_execution=steps_per_execution,
-                **kwargs,
-            )
-        else:
-            # apprently keras calls training_v1.py in graph mode which does not
-            # support the steps_per_execution arg.
-            super().compile(
-                optimizer=optimizer,
-                loss=loss,
-                metrics=metrics,
-                loss_weights=loss_weights,
-                weighted_metrics=weighted_metrics,
-                run_eagerly=run_eagerly,
-                **kwargs,
-            )
+        compile_kwargs = dict(
+            optimizer=optimizer,
+            loss=loss,
+            metrics=metrics,
+            loss_weights=loss_weights,
+            weighted_metrics=weighted_metrics,
+            run_eagerly=run_eagerly,
+            **kwargs,
+        )
+        if _COMPILE_SUPPORTS_SPE:
+            compile_kwargs["steps_per_execution"] = steps_per_execution
+        super().compile(**compile_kwargs)
 
     @property
     def _index(self) -> Indexer:
-        if not hasattr(self, "_ix") and self._ix:
+        # Note: `self._ix` is only read after the hasattr check so a missing
+        # index raises the explanatory error below instead of an opaque
+        # AttributeError from the attribute access itself.
+        if not hasattr(self, "_ix"):
             raise AttributeError(
                 "The model does not currently have an index. To create an "
                 "index you must call either model.compile() or "
@@ -315,10 +423,7 @@ class SimilarityModel(tf.keras.Model):
             raise ValueError("Embedding_output value exceed number of model outputs")
 
         if embedding_output is None and num_outputs > 1:
-            print(
-                "Embedding output set to be model output 0. ",
-                "Use the embedding_output arg to override this.",
-            )
+            logger.info("Embedding output set to be model output 0. Use the embedding_output arg to override this.")
             embedding_output = 0
 
         # fetch embedding size as some ANN libs requires it for init
@@ -337,6 +442,202 @@ class SimilarityModel(tf.keras.Model):
             stat_buffer_size=stat_buffer_size,
         )
 
+    def _forward_pass(self, batch: Tensor) -> FloatTensor:
+        """Inference forward pass shared by the cached predict functions.
+
+        Applies the optional reduced precision cast on the way in and always
+        returns the embeddings in the Keras float type so the index only
+        ever stores full precision embeddings.
+
+        Args:
+            batch: Batch of samples to compute the embeddings for.
+
+        Returns:
+            The model predictions for the batch.
+        """
+        if self._embedding_precision is not None:
+            dtype = _EMBEDDING_PRECISION_DTYPES[self._embedding_precision]
+            batch = tf.nest.map_structure(
+                lambda t: tf.cast(t, dtype) if t.dtype.is_floating else t,
+                batch,
+            )
+
+        out = self(batch, training=False)
+
+        floatx = tf.keras.backend.floatx()
+        # forcing type from Any to FloatTensor
+        restored: FloatTensor = tf.nest.map_structure(
+            lambda t: tf.cast(t, floatx) if t.dtype.is_floating and t.dtype != floatx else t,
+            out,
+        )
+        return restored
+
+    def _predict_all(self, x: Tensor, batch_size: int | None = None) -> FloatTensor:
+        """Compute the embeddings for every sample in `x`.
+
+        This is a lighter weight alternative to `Model.predict()` used by the
+        indexing and evaluation methods: the forward pass is wrapped once in a
+        `tf.function` that is reused across calls, and the samples are fed
+        through a prefetched `tf.data` pipeline, skipping the callback and
+        progress bar machinery `predict()` sets up on every invocation.
+
+        Args:
+            x: Samples to compute the embeddings for.
+
+            batch_size: Inference batch size. Defaults to the
+            `predict_batch_size` set in `compile()`.
+
+        Returns:
+            The model predictions for the samples.
+        """
+        if isinstance(x, (tf.data.Dataset, tf.keras.utils.Sequence)):
+            # These inputs define their own batching; use the stock path.
+            # forcing type from Any to FloatTensor
+            stock_preds: FloatTensor = self.predict(x)
+            return stock_preds
+
+        if batch_size is None:
+            batch_size = self._predict_batch_size
+
+        # Optional reuse of embeddings across back-to-back evaluations over
+        # the same input array. The identity based key means a hit can only
+        # happen while the caller still holds (and has not mutated) x.
+        cache_key = None
+        if self._predict_cache_size > 0 and hasattr(x, "shape") and hasattr(x, "dtype"):
+            cache_key = (id(x), tuple(x.shape), str(x.dtype), batch_size)
+            if cache_key in self._predict_cache:
+                self._predict_cache.move_to_end(cache_key)
+                # forcing type from Any to FloatTensor
+                cached: FloatTensor = self._predict_cache[cache_key]
+                return cached
+
+        if self._predict_fn is None:
+            self._predict_fn = tf.function(
+                self._forward_pass,
+                jit_compile=True if self._predict_use_xla else None,
+                reduce_retracing=True,
+            )
+
+        ds = tf.data.Dataset.from_tensor_slices(x)
+        # For large inputs, assemble the batches with parallel workers to
+        # overlap the host side copies with the forward passes. Batching must
+        # stay deterministic as the embeddings are positionally aligned with
+        # the labels downstream.
+        if int(ds.cardinality()) > 4 * batch_size:
+            ds = ds.batch(batch_size, num_parallel_calls=tf.data.AUTOTUNE, deterministic=True)
+        else:
+            ds = ds.batch(batch_size)
+        ds = ds.prefetch(tf.data.AUTOTUNE)
+
+        if self._predict_steps_per_execution > 1:
+            preds = self._predict_multi_step(ds)
+        else:
+            preds = [self._predict_fn(batch) for batch in ds]
+
+        # Single output models are written straight into a preallocated
+        # buffer: concatenating the per batch list would materialize the
+        # embeddings twice and double the peak memory.
+        first = preds[0]
+        if isinstance(first, tf.Tensor):
+            num_rows = sum(int(p.shape[0]) for p in preds)
+            out = np.empty((num_rows,) + tuple(first.shape[1:]), dtype=first.dtype.as_numpy_dtype)
+            offset = 0
+            for p in preds:
+                rows = int(p.shape[0])
+                out[offset : offset + rows] = p
+                offset += rows
+        else:
+            # Multi output models: concatenate each head into a contiguous
+            # host array so the indexer's row-wise access patterns stay
+            # sequential in memory, like the single output buffer above.
+            out = tf.nest.map_structure(
+                lambda *batches: np.ascontiguousarray(tf.concat(batches, axis=0)),
+                *preds,
+            )
+
+        if cache_key is not None:
+            self._predict_cache[cache_key] = out
+            while len(self._predict_cache) > self._predict_cache_size:
+                self._predict_cache.popitem(last=False)
+
+        # forcing type from ndarray to FloatTensor
+        return cast("FloatTensor", out)
+
+    def _predict_multi_step(self, ds: tf.data.Dataset) -> list[FloatTensor]:
+        """Run `predict_steps_per_execution` inference batches per call.
+
+        Grouping several batches in a single `tf.function` invocation
+        amortizes the per-call dispatch overhead, which dominates for small
+        models. Full groups go through an unrolled multi-step function and
+        the remaining batches fall back to the single-step one.
+
+        Args:
+            ds: Batched dataset of samples to predict on.
+
+        Returns:
+            The list of per batch predictions.
+        """
+        num_batches = int(ds.cardinality())
+        if num_batches < 0:
+            # Unknown cardinality: the full groups cannot be planned ahead.
+            return [self._predict_fn(batch) for batch in ds]
+
+        steps = self._predict_steps_per_execution
+        if self._predict_steps_fn is None:
+
+            def multi_step(iterator):
+                # The loop is unrolled at trace time so the `steps` forward
+                # passes dispatch as a single graph execution.
+                return [self._predict_fn(next(iterator)) for _ in range(steps)]
+
+            # The outer function must not be XLA compiled: IteratorGetNext
+            # has no XLA kernel. Only the inner forward passes are jitted,
+            # mirroring how Keras runs its own steps_per_execution loop.
+            self._predict_steps_fn = tf.function(
+                multi_step,
+                reduce_retracing=True,
+            )
+
+        iterator = iter(ds)
+        preds = []
+        for _ in range(num_batches // steps):
+            preds.extend(self._predict_steps_fn(iterator))
+        for _ in range(num_batches % steps):
+            preds.append(self._predict_fn(next(iterator)))
+        return preds
+
+    def _predict_single(self, x: Tensor) -> FloatTensor:
+        """Compute the embedding for a single, already expanded, sample.
+
+        Single sample calls always see the same [1, ...] input shape, so the
+        forward pass is traced once with a pinned input signature and every
+        subsequent call (e.g. online indexing or serving lookups) reuses the
+        same concrete function instead of re-dispatching through
+        `Model.predict`.
+
+        Args:
+            x: Batch of one sample to compute the embedding for.
+
+        Returns:
+            The model prediction for the sample.
+        """
+        if self._single_predict_fn is None:
+            signature = None
+            inputs = getattr(self, "inputs", None)
+            if inputs is not None and len(inputs) == 1:
+                shape = [1] + list(inputs[0].shape[1:])
+                signature = [tf.TensorSpec(shape=shape, dtype=inputs[0].dtype)]
+            self._single_predict_fn = tf.function(
+                self._forward_pass,
+                input_signature=signature,
+                jit_compile=True if self._predict_use_xla else None,
+                reduce_retracing=True,
+            )
+
+        # forcing type from Any to FloatTensor
+        prediction: FloatTensor = self._single_predict_fn(x)
+        return prediction
+
     def index(
         self,
         x: Tensor,
@@ -367,8 +668,47 @@ class SimilarityModel(tf.keras.Model):
             print(f"[Indexing {len(x)} points]")
             print("|-Computing embeddings")
 
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
 
+        self.index_embeddings(
+            predictions,
+            y=y,
+            data=data,
+            build=build,
+            verbose=verbose,
+        )
+
+    def index_embeddings(
+        self,
+        predictions: FloatTensor,
+        y: IntTensor | None = None,
+        data: Tensor | None = None,
+        build: bool = True,
+        verbose: int = 1,
+    ):
+        """Index precomputed embeddings.
+
+        Use this instead of `index()` when the embeddings are already
+        available, e.g. computed while evaluating or from a previous
+        `predict()` call, to avoid paying for a second forward pass which
+        is by far the dominant cost of indexing.
+
+        Args:
+            predictions: Model embeddings for the samples to index.
+
+            y: class ids associated with the embeddings if any.
+            Defaults to None.
+
+            data: store the data associated with the samples in the key
+            value store. Defaults to None.
+
+            build: Rebuild the index after indexing. This is needed to make the
+            new samples searchable. Set it to false to save processing time
+            when calling indexing repeatidly without the need to search between
+            the indexing requests. Defaults to True.
+
+            verbose: Output indexing progress info. Defaults to 1.
+        """
         self._index.batch_add(
             predictions=predictions,
             labels=y,
@@ -407,8 +747,9 @@ class SimilarityModel(tf.keras.Model):
             print("[Indexing 1 point]")
             print("|-Computing embeddings")
 
-        x = tf.expand_dims(x, axis=0)
-        prediction = self.predict(x)
+        # newaxis indexing builds the [1, ...] view without inserting an
+        # expand_dims op on every call; convert first so list inputs work.
+        prediction = self._predict_single(tf.convert_to_tensor(x)[tf.newaxis, ...])
 
         self._index.add(
             prediction=prediction,
@@ -432,7 +773,7 @@ class SimilarityModel(tf.keras.Model):
             list of list of k nearest neighboors:
             list[list[Lookup]]
         """
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
 
         return self._index.batch_lookup(predictions=predictions, k=k, verbose=verbose)
 
@@ -448,8 +789,9 @@ class SimilarityModel(tf.keras.Model):
             list of the k nearest neigboors info:
             list[Lookup]
         """
-        x = tf.expand_dims(x, axis=0)
-        prediction = self.predict(x)
+        # newaxis indexing builds the [1, ...] view without inserting an
+        # expand_dims op on every call; convert first so list inputs work.
+        prediction = self._predict_single(tf.convert_to_tensor(x)[tf.newaxis, ...])
 
         return self._index.single_lookup(prediction=prediction, k=k)
 
@@ -515,8 +857,18 @@ class SimilarityModel(tf.keras.Model):
         if thresholds_targets is None:
             thresholds_targets = {}
 
+        # fail fast before paying for the forward pass.
+        if len(x) == 0:
+            raise ValueError("x is empty: there is nothing to calibrate on.")
+
+        if len(y) != len(x):
+            raise ValueError(f"x and y must be the same length: got {len(x)} samples and {len(y)} labels.")
+
+        if self._index.size() == 0:
+            raise IndexError("Index must contain embeddings but is " "currently empty. Have you run model.index()?")
+
         # predict
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
 
         # calibrate
         return self._index.calibrate(
@@ -575,15 +927,25 @@ class SimilarityModel(tf.keras.Model):
             evaluation in a single go.
 
         """
-        # basic checks
-        if not self._index.is_calibrated:
+        # cache the index: _index is a property and these methods hit it
+        # several times per call.
+        idx = self._index
+
+        # basic checks, before paying for the forward pass.
+        if not idx.is_calibrated:
             raise ValueError("Uncalibrated model: run model.calibration()")
 
+        if len(x) == 0:
+            raise ValueError("x is empty: there is nothing to match.")
+
+        if idx.size() == 0:
+            raise IndexError("Index must contain embeddings but is " "currently empty. Have you run model.index()?")
+
         # get predictions
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
 
         # matching
-        matches = self._index.match(
+        matches = idx.match(
             predictions,
             no_match_label=no_match_label,
             k=k,
@@ -624,18 +986,19 @@ class SimilarityModel(tf.keras.Model):
         Raises:
             IndexError: Index must contain embeddings but is currently empty.
         """
-        if self._index.size() == 0:
+        idx = self._index
+        if idx.size() == 0:
             raise IndexError("Index must contain embeddings but is " "currently empty. Have you run model.index()?")
 
         # get embeddings
         if verbose:
             print("|-Computing embeddings")
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
 
         if verbose:
             print("|-Computing retrieval metrics")
 
-        results = self._index.evaluate_retrieval(
+        results = idx.evaluate_retrieval(
             predictions=predictions,
             target_labels=y,
             retrieval_metrics=retrieval_metrics,
@@ -661,7 +1024,7 @@ class SimilarityModel(tf.keras.Model):
         ],  # noqa
         matcher: str | ClassificationMatch = "match_nearest",
         verbose: int = 1,
-    ) -> defaultdict[str, dict[str, str | np.ndarray]]:
+    ) -> dict[str, dict[str, str | np.ndarray]]:
         """Evaluate model classification matching on a given evaluation dataset.
 
         Args:
@@ -694,61 +1057,74 @@ class SimilarityModel(tf.keras.Model):
         """
         # There is some code duplication in this function but that is the best
         # solution to keep the end-user API clean and doing inferences once.
-        if self._index.size() == 0:
+        idx = self._index
+        if idx.size() == 0:
             raise IndexError(
                 "Index must contain embeddings but is currently empty. Have " "you added examples via model.index()?"
             )
 
-        if not self._index.is_calibrated:
+        if not idx.is_calibrated:
             raise ValueError("Uncalibrated model: run model.calibration()")
 
-        cal_metric = self._index.get_calibration_metric()
+        cal_metric = idx.get_calibration_metric()
 
         # get embeddings
         if verbose:
             print("|-Computing embeddings")
-        predictions = self.predict(x)
+        predictions = self._predict_all(x)
+
+        # create a metric that match at the requested k
+        metric = make_classification_metric(cal_metric.name)
+        metrics = copy(extra_metrics)
+        metrics.append(metric)
+
+        # Evaluate all the cutpoint thresholds in a single pass: the index
+        # lookup and the match derivation are computed once and each metric
+        # returns one value per threshold. The matcher evaluates thresholds
+        # in ascending order so they are passed sorted and each cutpoint
+        # reads its row back through its sorted position.
+        distance_thresholds = [float(cp_data["distance"]) for cp_data in idx.cutpoints.values()]
+        sorted_thresholds = sorted(distance_thresholds)
+        evaluated = idx.evaluate_classification(
+            predictions,
+            y,
+            sorted_thresholds,
+            metrics=metrics,
+            matcher=matcher,
+            k=k,
+        )
 
-        results: defaultdict[str, dict[str, str | np.ndarray]] = defaultdict(dict)
+        # One constant for all the thresholds; each cutpoint slices its own
+        # [1] view out of it instead of allocating a fresh tf.constant.
+        distances_tf = tf.constant(distance_thresholds, dtype=tf.keras.backend.floatx())
 
-        if verbose:
-            pb = tqdm(total=len(self._index.cutpoints), desc="Evaluating cutpoints")
-
-        for cp_name, cp_data in self._index.cutpoints.items():
-            # create a metric that match at the requested k and threshold
-            distance_threshold = float(cp_data["distance"])
-            metric = make_classification_metric(cal_metric.name)
-            metrics = copy(extra_metrics)
-            metrics.append(metric)
-
-            res: dict[str, str | np.ndarray] = {}
-            res.update(
-                self._index.evaluate_classification(
-                    predictions,
-                    y,
-                    [distance_threshold],
-                    metrics=metrics,
-                    matcher=matcher,
-                    k=k,
-                )
-            )
-            res["distance"] = tf.constant([distance_threshold], dtype=tf.keras.backend.floatx())
+        results: dict[str, dict[str, str | np.ndarray]] = {name: {} for name in idx.cutpoints}
+
+        # The heavy lifting happened in the fused evaluation above; only
+        # show a progress bar when there are enough cutpoints for the
+        # redistribution loop to be noticeable.
+        show_pb = verbose and len(results) >= 8
+        if show_pb:
+            pb = tqdm(total=len(results), desc="Evaluating cutpoints")
+
+        for i, cp_name in enumerate(results):
+            pos = sorted_thresholds.index(distance_thresholds[i])
+            res: dict[str, str | np.ndarray] = {name: values[pos : pos + 1] for name, values in evaluated.items()}
+            res["distance"] = distances_tf[i : i + 1]
             res["name"] = cp_name
             results[cp_name] = res
-            if verbose:
+            if show_pb:
                 pb.update()
 
-        if verbose:
+        if show_pb:
             pb.close()
 
         if verbose:
             headers = ["name", cal_metric.name]
-            for i in results["optimal"].keys():
-                if i not in headers:
-                    headers.append(str(i))
-            rows = []
-            for data in results.values():
-                rows.append([data[v] for v in headers])
+            for key in (*evaluated, "distance"):
+                if key not in headers:
+                    headers.append(str(key))
+            rows = [[data[v] for v in headers] for data in results.values()]
             print("\n [Summary]\n")
             print(tabulate(rows, headers=headers))
 
@@ -774,16 +1150,36 @@ class SimilarityModel(tf.keras.Model):
         index_path = Path(filepath) / "index"
         self._index = Indexer.load(index_path)
 
-    def save_index(self, filepath, compression=True, overwrite=True):
+    def save_index(
+        self, filepath, compression=True, overwrite=True, io_threads=0, num_shards=1, direct_io=False, quantize="none"
+    ):
         """Save the index to disk
 
         Args:
             path: directory where to save the index
             compression: Store index data compressed. Defaults to True.
             overwrite: Overwrite previous index. Defaults to False.
+            io_threads: Number of threads used to write the index artifacts
+            concurrently. Values below 2 keep the writes sequential.
+            Defaults to 0.
+            num_shards: When above 1, partition the key value store records
+            by row range and write the shards in parallel. Defaults to 1.
+            direct_io: Write the key value store through raw file
+            descriptors and drop the written pages from the page cache.
+            Local filesystems only. Defaults to False.
+            quantize: Store the embeddings at reduced precision, "int8" or
+            "fp16". Defaults to "none" (full precision).
         """
         index_path = Path(filepath) / "index"
-        self._index.save(index_path, compression=compression, overwrite=overwrite)
+        self._index.save(
+            index_path,
+            compression=compression,
+            overwrite=overwrite,
+            io_threads=io_threads,
+            num_shards=num_shards,
+            direct_io=direct_io,
+            quantize=quantize,
+        )
 
     def save(
         self,
@@ -792,6 +1188,10 @@ class SimilarityModel(tf.keras.Model):
         compression: bool = True,
         overwrite: bool = True,
         include_optimizer: bool = True,
+        io_threads: int = 0,
+        num_shards: int = 1,
+        quantize: str = "none",
+        skip_unchanged: bool = False,
         save_format: str | None = None,
         signatures=None,
         options=None,
@@ -810,6 +1210,25 @@ class SimilarityModel(tf.keras.Model):
 
             include_optimizer: Save optimizer state. Defaults to True.
 
+            io_threads: Number of threads used to write the index artifacts
+            concurrently. Values below 2 keep the writes sequential.
+            Defaults to 0.
+
+            num_shards: When above 1, partition the key value store records
+            by row range and write the shards in parallel. Defaults to 1.
+
+            quantize: Store the index embeddings at reduced precision,
+            "int8" or "fp16". Defaults to "none" (full precision).
+
+            skip_unchanged: When True, skip the (expensive) Keras graph and
+            weights serialization if neither the model config nor the
+            weight values changed since the last save to the same filepath,
+            writing only the index. When the index size and calibration
+            state are also unchanged the save returns without touching the
+            disk at all. Useful for online index updates where the model
+            itself is frozen and for deduplicating redundant checkpoint
+            calls. Defaults to False.
+
             save_format: Either 'tf' or 'h5', indicating whether to save the
             model to Tensorflow SavedModel or HDF5. Defaults to 'tf' in
             TF 2.X, and 'h5' in TF 1.X.
@@ -827,44 +1246,105 @@ class SimilarityModel(tf.keras.Model):
             custom layers/models implement a get_config() method.
         """
 
-        # call underlying keras method to save the mode graph and its weights
-        super().save(
-            filepath,
-            overwrite=overwrite,
-            include_optimizer=include_optimizer,
-            save_format=save_format,
-            signatures=signatures,
-            options=options,
-            save_traces=save_traces,
-        )
-
-        if hasattr(self, "_ix") and self._index and save_index:
-            self.save_index(filepath, compression=compression, overwrite=overwrite)
+        # cache the attribute probes: hasattr goes through the exception
+        # machinery and save() runs on the per-epoch checkpointing path.
+        has_ix = "_ix" in self.__dict__
+        has_index = has_ix and self.__dict__["_ix"] is not None
+
+        sig = None
+        index_sig = None
+        skip_model_write = False
+        if skip_unchanged:
+            sig = self._save_signature()
+            if has_index:
+                index_sig = (self.__dict__["_ix"].size(), self.__dict__["_ix"].is_calibrated)
+            skip_model_write = sig == self._last_save_sig and str(filepath) == self._last_save_path
+            if skip_model_write and index_sig == self._last_index_sig:
+                # redundant save: neither the model nor the index moved
+                # since the last save to this destination.
+                return
+
+        if all(
+            (overwrite, include_optimizer, save_traces, save_format is None, signatures is None, options is None)
+        ):
+            save_kwargs: dict[str, Any] = _DEFAULT_SAVE_KWARGS
         else:
-            msg = "The index was not saved with the model."
-            if not hasattr(self, "_ix"):
-                msg = msg + (
-                    "The model does not currently have an index. To use indexing "
-                    "you must call either model.compile() or model.create_index() "
-                    "and set a valid Distance."
-                )
+            save_kwargs = {
+                "overwrite": overwrite,
+                "include_optimizer": include_optimizer,
+                "save_format": save_format,
+                "signatures": signatures,
+                "options": options,
+                "save_traces": save_traces,
+            }
 
-            if not save_index:
-                msg = msg + " The save_index param is set to False."
-
-            print(msg)
+        # call underlying keras method to save the mode graph and its weights
+        def write_model():
+            if skip_model_write:
+                return
+            super(SimilarityModel, self).save(filepath, **save_kwargs)
+
+        if has_index and save_index:
+            # The model graph/weights and the index artifacts go to disjoint
+            # files and are both I/O bound, so overlap the two writes instead
+            # of paying for them back to back.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(write_model),
+                    executor.submit(
+                        self.save_index,
+                        filepath,
+                        compression=compression,
+                        overwrite=overwrite,
+                        io_threads=io_threads,
+                        num_shards=num_shards,
+                        quantize=quantize,
+                    ),
+                ]
+                # resolve the futures to surface any write error.
+                for future in futures:
+                    future.result()
+        else:
+            write_model()
+            logger.info("%s", _INDEX_NOT_SAVED_MSGS[(has_ix, bool(save_index))])
 
-    def to_data_frame(self, num_items: int = 0) -> PandasDataFrame:
+        if skip_unchanged:
+            self._last_save_sig = sig
+            self._last_save_path = str(filepath)
+            self._last_index_sig = index_sig
+        else:
+            # a plain save may leave newer files at the path than the last
+            # recorded digest, so drop it rather than risk a stale skip.
+            self._last_save_sig = None
+            self._last_save_path = None
+            self._last_index_sig = None
+
+    def _save_signature(self) -> str:
+        """Fast digest of the model config and weight values, used to detect
+        checkpoint writes that would rewrite identical model files."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(json.dumps(self.get_config(), default=str, sort_keys=True).encode())
+        for w in self.weights:
+            h.update(np.asarray(w).tobytes())
+        return h.hexdigest()
+
+    def to_data_frame(self, num_items: int = 0, chunk_size: int = 0) -> PandasDataFrame:
         """Export data as pandas dataframe
 
         Args:
             num_items (int, optional): Num items to export to the dataframe.
             Defaults to 0 (unlimited).
 
+            chunk_size (int, optional): When set, stream the records as a
+            generator of `(start, end, dataframe)` tuples of at most
+            `chunk_size` rows each instead of materializing a single
+            dataframe. Defaults to 0 (single dataframe).
+
         Returns:
-            pd.DataFrame: a pandas dataframe.
+            pd.DataFrame: a pandas dataframe, or a generator of
+            `(start, end, pd.DataFrame)` tuples when `chunk_size` is set.
         """
-        return self._index.to_data_frame(num_items=num_items)
+        return self._index.to_data_frame(num_items=num_items, chunk_size=chunk_size)
 
     # We don't need from_config as the index is reloaded separatly.
     # this is kept as a reminder that it was looked into and decided to split
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
 import pickle
+import struct
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -21,6 +23,10 @@ from .search import Search
 INITIAL_DB_SIZE = 10000
 DB_SIZE_STEPS = 10000
 
+# Marks index files whose embedding buffers are stored out-of-band after the
+# pickle stream (protocol 5). Files without it are plain pickle streams.
+_PICKLE5_MAGIC = b"TFSIM\x05"
+
 
 class LinearSearch(Search):
     """This class implements the Linear Search interface.
@@ -123,10 +129,40 @@ class LinearSearch(Search):
         Args:
             path: where to store the data
         """
-        with open(self._make_file_path(path), "wb") as f:
-            pickle.dump((self._index, self.ids), f)
+        # Protocol 5 with out-of-band buffers hands the raw embedding
+        # buffers straight to the file instead of copying them into the
+        # pickle stream first.
+        buffers: list[pickle.PickleBuffer] = []
+        payload = pickle.dumps((self._index, self.ids), protocol=5, buffer_callback=buffers.append)
+        views = [buf.raw() for buf in buffers]
+        header = struct.pack(f"<{len(views) + 2}Q", len(payload), len(views), *(v.nbytes for v in views))
+        segments: list[bytes | memoryview] = [_PICKLE5_MAGIC, header, payload, *views]
+        # buffering=0: the segments are written whole, so the extra copy
+        # through a BufferedWriter buys nothing.
+        with open(self._make_file_path(path), "wb", buffering=0) as f:
+            if hasattr(os, "writev"):
+                # vectored write: header and buffers leave in one syscall
+                # batch without being coalesced into a copy first.
+                self._writev(f.fileno(), segments)
+            else:
+                for segment in segments:
+                    f.write(segment)
         self._save_config(path)
 
+    @staticmethod
+    def _writev(fd, segments):
+        "Write all segments with as few syscalls as vectored IO allows."
+        pending = [memoryview(segment).cast("B") for segment in segments if len(segment)]
+        while pending:
+            written = os.writev(fd, pending[:1024])
+            while written:
+                if written >= len(pending[0]):
+                    written -= len(pending[0])
+                    pending.pop(0)
+                else:
+                    pending[0] = pending[0][written:]
+                    written = 0
+
     def load(self, path: Path | str):
         """load index on disk
 
@@ -134,7 +170,31 @@ class LinearSearch(Search):
             path: where to store the data
         """
         with open(self._make_file_path(path), "rb") as f:
-            data = pickle.load(f)
+            if hasattr(os, "posix_fadvise"):
+                # hint the sequential full-file read so readahead ramps up
+                # immediately.
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            raw = f.read()
+        if raw[: len(_PICKLE5_MAGIC)] == _PICKLE5_MAGIC:
+            off = len(_PICKLE5_MAGIC)
+            payload_len, n_buffers = struct.unpack_from("<2Q", raw, off)
+            off += 16
+            sizes = struct.unpack_from(f"<{n_buffers}Q", raw, off)
+            off += 8 * n_buffers
+            payload = raw[off : off + payload_len]
+            off += payload_len
+            # the out-of-band buffers are zero-copy views into the file
+            # bytes, so the embeddings are never duplicated while loading.
+            view = memoryview(raw)
+            buffers = []
+            for size in sizes:
+                buffers.append(view[off : off + size])
+                off += size
+            data = pickle.loads(payload, buffers=buffers)
+        else:
+            # index written before the out-of-band format.
+            data = pickle.loads(raw)
         self._index = data[0]
         self.ids = data[1]
 
@@ -168,7 +228,7 @@ class LinearSearch(Search):
 
     def _save_config(self, path):
         with open(self._make_config_path(path), "wt") as f:
-            json.dump(self.get_config(), f)
+            f.write(json.dumps(self.get_config()))
 
     def _make_file_path(self, path):
         return Path(path) / "index.pickle"
@@ -148,13 +148,16 @@ class CachedStore(Store):
         "Number of record in the key value store."
         return self.num_items
 
-    def save(self, path: Path | str, compression: bool = True) -> None:
+    def save(self, path: Path | str, compression: bool | str = True) -> None:
         """Serializes index on disk.
 
         Args:
             path: where to store the data.
-            compression: Compress index data. Defaults to True.
+            compression: Compress index data. Defaults to True. Only the
+            default codec is supported; codec names raise.
         """
+        if isinstance(compression, str):
+            raise ValueError(f"{self.name} store does not support '{compression}' compression.")
         # Writing to a buffer to avoid read error in np.savez when using GFile.
         # See: https://github.com/tensorflow/tensorflow/issues/32090
         self._close_all_shards()
@@ -178,16 +181,21 @@ class CachedStore(Store):
             self._add_new_shard()
         return self.size()
 
-    def to_data_frame(self, num_records: int = 0) -> PandasDataFrame:
+    def to_data_frame(self, num_records: int = 0, chunk_size: int = 0) -> PandasDataFrame:
         """Export data as a Pandas dataframe.
 
         Args:
             num_records: Number of records to export to the dataframe.
             Defaults to 0 (unlimited).
 
+            chunk_size: Chunked export is not supported by this store;
+            any non-zero value raises. Defaults to 0.
+
         Returns:
             Empty DataFrame
         """
+        if chunk_size:
+            raise NotImplementedError(f"{self.name} store does not support chunked export.")
         if num_records:
             idxs = list(range(num_records))
             embeddings, labels, data = self.batch_get(idxs)
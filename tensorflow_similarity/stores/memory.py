@@ -14,8 +14,12 @@
 from __future__ import annotations
 
 import io
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import numpy as np
 import pandas as pd
@@ -27,6 +31,11 @@ if TYPE_CHECKING:
 
 from .store import Store
 
+logger = logging.getLogger(__name__)
+
+# initial row capacity of the mmap embedding table; grows by doubling.
+_INITIAL_MMAP_ROWS = 1024
+
 
 class MemoryStore(Store):
     """Efficient in-memory dataset store"""
@@ -35,15 +44,37 @@ class MemoryStore(Store):
         self,
         name: str = "memory",
         verbose: int = 0,
+        backing: str = "list",
+        mmap_dir: Path | str | None = None,
         **kwargs,
     ) -> None:
+        """Build the store.
+
+        Args:
+            name: Name of the store. Defaults to "memory".
+            verbose: Be verbose. Defaults to 0.
+            backing: How to hold the embeddings. "list" (the default) keeps
+            them on the process heap. "mmap" backs them with a file-backed
+            numpy.memmap that grows by doubling: large indexes then live in
+            the page cache instead of the process RSS and the OS handles
+            eviction, at the cost of needing a writable directory.
+            mmap_dir: Directory used for the mmap backing file. Defaults to
+            the system temp directory.
+        """
         super().__init__(name=name, verbose=verbose)
+        if backing not in ("list", "mmap"):
+            raise ValueError(f"Unknown backing: {backing}. Expected 'list' or 'mmap'.")
         # We are using a native python array in memory for its row speed.
         # Serialization / export relies on Arrow.
         self.labels: list[int | None] = []
         self.embeddings: list[FloatTensor] = []
         self.data: list[Tensor | None] = []
         self.num_items: int = 0
+        self.backing = backing
+        self._mmap_dir = mmap_dir
+        self._emb_path: str | None = None
+        self._emb_map: np.memmap | None = None
+        self._capacity: int = 0
 
     def add(
         self,
@@ -65,7 +96,10 @@ class MemoryStore(Store):
         """
         idx = self.num_items
         self.labels.append(label)
-        self.embeddings.append(embedding)
+        if self.backing == "mmap":
+            self._append_embedding(embedding)
+        else:
+            self.embeddings.append(embedding)
         self.data.append(data)
         self.num_items += 1
         return idx
@@ -133,33 +167,135 @@ class MemoryStore(Store):
         "Number of record in the key value store."
         return self.num_items
 
-    def save(self, path: Path | str, compression: bool = True) -> None:
+    def save(
+        self,
+        path: Path | str,
+        compression: bool | str = True,
+        num_shards: int = 1,
+        direct_io: bool = False,
+        quantize: str = "none",
+    ) -> None:
         """Serializes index on disk.
 
         Args:
             path: where to store the data.
-            compression: Compress index data. Defaults to True.
+            compression: Compress index data. True (the default) uses the
+            zipfile deflate compression built into np.savez_compressed.
+            "zstd" wraps the raw archive in a zstandard frame (level 3),
+            which is both smaller and faster to write on float embeddings
+            but requires the optional zstandard package. False stores the
+            data uncompressed.
+            num_shards: When above 1, partition the records by row range
+            and write the shards concurrently as index-<k>.npz files.
+            Useful on object stores and parallel filesystems where a
+            single stream cannot saturate the available bandwidth.
+            Defaults to 1.
+            direct_io: Write through a raw file descriptor, fsync, and ask
+            the kernel to drop the written pages so a large checkpoint does
+            not evict the training working set from the page cache. Local
+            filesystems only. Defaults to False.
+            quantize: Store the embeddings at reduced precision: "int8"
+            keeps one byte per dimension plus a float16 per-row scale
+            (near lossless for L2-normalized embeddings), "fp16" halves
+            the storage. Both quarter/halve the bytes written and read
+            back; the embeddings are restored to float32 on load.
+            Defaults to "none" (full precision).
         """
+        if isinstance(compression, str) and compression != "zstd":
+            raise ValueError(f"Unknown compression codec: {compression}. Expected True, False or 'zstd'.")
+        if quantize not in ("none", "int8", "fp16"):
+            raise ValueError(f"Unknown quantize mode: {quantize}. Expected 'none', 'int8' or 'fp16'.")
+        fname = self._make_fname(path)
+        if num_shards > 1:
+            bounds = np.linspace(0, self.num_items, num_shards + 1, dtype=int)
+            with ThreadPoolExecutor(max_workers=num_shards) as executor:
+                futures = []
+                for k in range(num_shards):
+                    start, end = int(bounds[k]), int(bounds[k + 1])
+                    futures.append(
+                        executor.submit(
+                            self._write_records,
+                            fname.with_name(f"index-{k}.npz"),
+                            self.embeddings[start:end],
+                            self.labels[start:end],
+                            self.data[start:end],
+                            compression,
+                            direct_io,
+                            quantize,
+                        )
+                    )
+                # resolve the futures to surface any write error.
+                for future in futures:
+                    future.result()
+        else:
+            self._write_records(fname, self.embeddings, self.labels, self.data, compression, direct_io, quantize)
+
+    def _write_records(
+        self, fname, embeddings, labels, data, compression, direct_io: bool = False, quantize: str = "none"
+    ) -> None:
+        "Serialize a range of records into a single archive on disk."
+        if quantize == "int8":
+            emb = np.asarray(embeddings, dtype=np.float32)
+            # symmetric per-row quantization: 1 byte per dimension plus a
+            # float16 scale per row.
+            scales = np.abs(emb).max(axis=1, keepdims=True) / 127.0
+            scales[scales == 0] = 1.0
+            emb_arrays = {
+                "embeddings_q": np.round(emb / scales).astype(np.int8),
+                "embeddings_scale": scales.astype(np.float16),
+            }
+        elif quantize == "fp16":
+            emb_arrays = {"embeddings_f16": np.asarray(embeddings, dtype=np.float32).astype(np.float16)}
+        else:
+            emb_arrays = {"embeddings": embeddings}
+
         # Writing to a buffer to avoid read error in np.savez when using GFile.
         # See: https://github.com/tensorflow/tensorflow/issues/32090
         io_buffer = io.BytesIO()
-        if compression:
-            np.savez_compressed(
-                io_buffer,
-                embeddings=self.embeddings,
-                labels=np.array(self.labels),
-                data=np.array(self.data),
-            )
+        savez = np.savez_compressed if compression and compression != "zstd" else np.savez
+        savez(
+            io_buffer,
+            labels=np.array(labels),
+            data=np.array(data),
+            **emb_arrays,
+        )
+
+        chunks = self._payload_chunks(io_buffer, compression)
+        if direct_io:
+            # Local-filesystem fast path: write through a raw fd, fsync, and
+            # tell the kernel to drop the written pages so a large checkpoint
+            # does not evict the training working set from the page cache.
+            fd = os.open(str(fname), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                for chunk in chunks:
+                    os.write(fd, chunk)
+                os.fsync(fd)
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
         else:
-            np.savez(
-                io_buffer,
-                embeddings=self.embeddings,
-                labels=np.array(self.labels),
-                data=np.array(self.data),
-            )
-
-        with tf.io.gfile.GFile(self._make_fname(path), "wb+") as f:
-            f.write(io_buffer.getvalue())
+            with tf.io.gfile.GFile(fname, "wb+") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+
+    def _payload_chunks(self, io_buffer, compression):
+        "Yield the serialized archive as write-sized byte chunks."
+        if compression == "zstd":
+            zstandard = self._try_import_zstandard()
+            # Compress in 1MB chunks: compressing the next chunk overlaps
+            # the kernel flushing the previous write, and the compressed
+            # payload is never materialized in full.
+            cobj = zstandard.ZstdCompressor(level=3).compressobj()
+            view = io_buffer.getbuffer()
+            chunk_bytes = 1 << 20
+            for start in range(0, len(view), chunk_bytes):
+                out = cobj.compress(bytes(view[start : start + chunk_bytes]))
+                if out:
+                    yield out
+            yield cobj.flush()
+        else:
+            yield io_buffer.getvalue()
 
     def load(self, path: str) -> int:
         """load index on disk
@@ -170,32 +306,75 @@ class MemoryStore(Store):
         Returns:
            Number of records reloaded.
         """
-        fname = self._make_fname(path, check_file_exit=True)
-        with tf.io.gfile.GFile(fname, "rb") as gfp:
-            data = np.load(gfp, allow_pickle=True)
-        self.embeddings = list(data["embeddings"])
-        self.labels = list(data["labels"])
-        self.data = list(data["data"])
-        self.num_items = len(self.embeddings)
-        print("loaded %d records from %s" % (self.size(), path))
+        fname = self._make_fname(path)
+        if tf.io.gfile.exists(fname):
+            shard_fnames = [fname]
+        else:
+            # sharded save: reload index-<k>.npz files in shard order so
+            # record ids keep their positions.
+            shard_fnames = sorted(
+                tf.io.gfile.glob(str(fname.with_name("index-*.npz"))),
+                key=lambda f: int(Path(f).stem.split("-")[1]),
+            )
+            if not shard_fnames:
+                raise ValueError("Index file not found")
+
+        self.reset()
+        for shard_fname in shard_fnames:
+            embeddings, labels, data = self._read_records(shard_fname)
+            # batch_add keeps both the list and the mmap backing in sync.
+            self.batch_add(embeddings, labels, data)
+        logger.info("loaded %d records from %s", self.size(), path)
         return self.size()
 
-    def to_data_frame(self, num_records: int = 0) -> PandasDataFrame:
+    def _read_records(self, fname) -> tuple[list, list, list]:
+        "Deserialize a single archive written by _write_records."
+        with tf.io.gfile.GFile(fname, "rb") as gfp:
+            raw = gfp.read()
+        # sniff the zstandard frame magic so zstd compressed indexes reload
+        # transparently.
+        if raw[:4] == b"\x28\xb5\x2f\xfd":
+            zstandard = self._try_import_zstandard()
+            # the frame is written streamed so it carries no content size:
+            # use the streaming decompressor.
+            raw = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        data = np.load(io.BytesIO(raw), allow_pickle=True)
+        if "embeddings_q" in data:
+            emb = data["embeddings_q"].astype(np.float32) * data["embeddings_scale"].astype(np.float32)
+            embeddings = list(emb)
+        elif "embeddings_f16" in data:
+            embeddings = list(data["embeddings_f16"].astype(np.float32))
+        else:
+            embeddings = list(data["embeddings"])
+        return embeddings, list(data["labels"]), list(data["data"])
+
+    def to_data_frame(self, num_records: int = 0, chunk_size: int = 0):
         """Export data as a Pandas dataframe.
 
         Args:
             num_records: Number of records to export to the dataframe.
             Defaults to 0 (unlimited).
 
+            chunk_size: When set, stream the records as a generator of
+            `(start, end, dataframe)` tuples of at most `chunk_size` rows
+            each instead of materializing a single dataframe. Peak memory
+            stays flat regardless of the index size. Defaults to 0
+            (single dataframe).
+
         Returns:
-            pd.DataFrame: a pandas dataframe.
+            pd.DataFrame: a pandas dataframe, or a generator of
+            `(start, end, pd.DataFrame)` tuples when `chunk_size` is set.
         """
 
         if not num_records:
             num_records = self.num_items
 
+        if chunk_size:
+            return self._data_frame_chunks(num_records, chunk_size)
+
         records = {
-            "embeddings": self.embeddings[:num_records],
+            # list() turns a mmap-backed 2D slice into rows.
+            "embeddings": list(self.embeddings[:num_records]),
             "data": self.data[:num_records],
             "labels": self.labels[:num_records],
         }
@@ -204,11 +383,114 @@ class MemoryStore(Store):
         df: PandasDataFrame = pd.DataFrame.from_dict(records)
         return df
 
+    def to_arrow_table(self, num_records: int = 0):
+        """Export data as a pyarrow Table.
+
+        Unlike `to_data_frame`, the embeddings come out as a FixedSizeList
+        of float32 backed by a single contiguous buffer and the labels are
+        dictionary encoded, so exporting to parquet or CSV can skip the
+        pandas materialization entirely. Requires the optional pyarrow
+        package.
+
+        Args:
+            num_records: Number of records to export to the table.
+            Defaults to 0 (unlimited).
+
+        Returns:
+            pa.Table: a pyarrow table.
+        """
+        pa = self._try_import_pyarrow()
+
+        if not num_records:
+            num_records = self.num_items
+
+        emb = np.ascontiguousarray(np.asarray(self.embeddings[:num_records], dtype=np.float32))
+        dim = emb.shape[1] if emb.ndim == 2 else 0
+        embeddings = pa.FixedSizeListArray.from_arrays(pa.array(emb.reshape(-1)), dim)
+        labels = pa.array(self.labels[:num_records]).dictionary_encode()
+        try:
+            data = pa.array(np.asarray(self.data[:num_records]).tolist())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError, TypeError):
+            # data holds arbitrary user payloads; fall back to nulls when
+            # they have no Arrow representation.
+            data = pa.nulls(num_records)
+
+        return pa.Table.from_arrays([embeddings, data, labels], names=["embeddings", "data", "labels"])
+
+    def _data_frame_chunks(self, num_records: int, chunk_size: int):
+        "Yield (start, end, dataframe) slices of at most chunk_size rows."
+        for start in range(0, num_records, chunk_size):
+            end = min(start + chunk_size, num_records)
+            records = {
+                "embeddings": list(self.embeddings[start:end]),
+                "data": self.data[start:end],
+                "labels": self.labels[start:end],
+            }
+            yield start, end, pd.DataFrame.from_dict(records)
+
     def reset(self):
         self.labels = []
         self.embeddings = []
         self.data = []
         self.num_items = 0
+        if self.backing == "mmap":
+            self._emb_map = None
+            self._capacity = 0
+            if self._emb_path is not None and os.path.exists(self._emb_path):
+                os.unlink(self._emb_path)
+            self._emb_path = None
+
+    def _append_embedding(self, embedding) -> None:
+        "Write one embedding row into the growable mmap table."
+        embedding = np.asarray(embedding)
+        if self._emb_map is None:
+            fd, self._emb_path = tempfile.mkstemp(suffix=".emb", dir=self._mmap_dir)
+            os.close(fd)
+            self._emb_dim = int(embedding.shape[-1])
+            self._emb_dtype = embedding.dtype
+            self._grow(_INITIAL_MMAP_ROWS)
+        elif self.num_items >= self._capacity:
+            self._grow(self._capacity * 2)
+        assert self._emb_map is not None
+        self._emb_map[self.num_items] = embedding
+        # keep self.embeddings pointing at the used prefix so slicing and
+        # iteration behave like the list backing.
+        self.embeddings = cast("list[FloatTensor]", self._emb_map[: self.num_items + 1])
+
+    def _grow(self, new_capacity: int) -> None:
+        "Extend the mmap backing file and remap it at the new capacity."
+        assert self._emb_path is not None
+        if self._emb_map is not None:
+            self._emb_map.flush()
+            self._emb_map = None
+        row_bytes = self._emb_dim * np.dtype(self._emb_dtype).itemsize
+        with open(self._emb_path, "r+b") as f:
+            f.truncate(new_capacity * row_bytes)
+        self._emb_map = np.memmap(
+            self._emb_path,
+            dtype=self._emb_dtype,
+            mode="r+",
+            shape=(new_capacity, self._emb_dim),
+        )
+        self._capacity = new_capacity
+
+    def _try_import_pyarrow(self):
+        try:
+            import pyarrow
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "pyarrow is not installed. Please install it with `pip install pyarrow`"
+            ) from e
+        return pyarrow
+
+    def _try_import_zstandard(self):
+        try:
+            import zstandard
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                "zstandard is not installed. Please install it with `pip install zstandard`"
+            ) from e
+        return zstandard
 
     def _make_fname(self, path: Path | str, check_file_exit: bool = False) -> Path:
         p = Path(path)
@@ -104,12 +104,15 @@ class Store(ABC):
         "Number of record in the key value store."
 
     @abstractmethod
-    def save(self, path: Path | str, compression: bool = True) -> None:
+    def save(self, path: Path | str, compression: bool | str = True) -> None:
         """Serializes index on disk.
 
         Args:
             path: Directory where to store the data.
-            compression: Compress index data. Defaults to True.
+            compression: Compress index data. Defaults to True. Stores may
+            accept a codec name (e.g. "zstd"); stores that only support
+            their default codec must reject unknown values rather than
+            silently ignore them.
         """
 
     @abstractmethod
@@ -124,16 +127,38 @@ class Store(ABC):
         """
 
     @abstractmethod
-    def to_data_frame(self, num_records: int = 0) -> PandasDataFrame:
+    def to_data_frame(self, num_records: int = 0, chunk_size: int = 0) -> PandasDataFrame:
         """Export data as a Pandas dataframe.
 
         Args:
             num_records: Number of records to export to the dataframe.
             Defaults to 0 (unlimited).
 
+            chunk_size: When set, stream the records as a generator of
+            `(start, end, dataframe)` tuples of at most `chunk_size` rows
+            each instead of materializing a single dataframe. Stores
+            without chunked export must raise NotImplementedError when it
+            is set. Defaults to 0 (single dataframe).
+
+        Returns:
+            pd.DataFrame: a pandas dataframe, or a generator of
+            `(start, end, pd.DataFrame)` tuples when `chunk_size` is set.
+        """
+
+    def to_arrow_table(self, num_records: int = 0) -> Any:
+        """Export data as a pyarrow Table.
+
+        Stores that can expose their records as contiguous Arrow buffers
+        override this; the default raises.
+
+        Args:
+            num_records: Number of records to export to the table.
+            Defaults to 0 (unlimited).
+
         Returns:
-            pd.DataFrame: a pandas dataframe.
+            pa.Table: a pyarrow table.
         """
+        raise NotImplementedError(f"{self.name} store does not support Arrow export.")
 
     @abstractmethod
     def reset(self) -> None:
@@ -11,10 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+from unittest.mock import patch
+
 import tensorflow as tf
 
+from tensorflow_similarity.distances import CosineDistance
 from tensorflow_similarity.losses import TripletLoss
 from tensorflow_similarity.models import SimilarityModel
+from tensorflow_similarity.search import LinearSearch
+from tensorflow_similarity.stores import MemoryStore
 
 
 class SimilarityModelTest(tf.test.TestCase):
@@ -51,6 +57,73 @@ class SimilarityModelTest(tf.test.TestCase):
         model2 = tf.keras.models.load_model(out_dir)
         self.assertIsInstance(model2, type(model))
 
+    def test_predict_steps_per_execution(self):
+        inputs = tf.keras.layers.Input(shape=(3,))
+        outputs = tf.keras.layers.Dense(2)(inputs)
+        model = SimilarityModel(inputs, outputs)
+        model.compile(
+            optimizer="adam",
+            loss=TripletLoss(reduction="sum_over_batch_size"),
+            steps_per_execution=2,
+            distance=CosineDistance(),
+            search=LinearSearch(distance=CosineDistance(), dim=2),
+            kv_store=MemoryStore(),
+            predict_batch_size=8,
+        )
+
+        # 37 samples over batches of 8: two full two-step groups plus a
+        # remainder batch, exercising both the multi-step function and the
+        # single-step fallback with the default XLA setting.
+        x = tf.random.uniform((37, 3))
+        y = tf.range(37)
+        model.index(x, y)
+        self.assertEqual(model._index.size(), 37)
+
+    def test_save_skip_unchanged(self):
+        out_dir = os.path.join(self.get_temp_dir(), "first")
+        other_dir = os.path.join(self.get_temp_dir(), "second")
+
+        inputs = tf.keras.layers.Input(shape=(3,))
+        outputs = tf.keras.layers.Dense(2)(inputs)
+        model = SimilarityModel(inputs, outputs)
+        model.create_index(
+            distance=CosineDistance(),
+            search=LinearSearch(distance=CosineDistance(), dim=2),
+            kv_store=MemoryStore(),
+        )
+
+        # index data
+        x = tf.constant([[1, 1, 3], [3, 1, 2]], dtype="float32")
+        y = tf.constant([1, 2])
+        model.index(x, y)
+
+        # mock out the Keras serialization so the test observes when the
+        # model write is skipped versus performed.
+        with patch.object(tf.keras.Model, "save") as keras_save:
+            model.save(out_dir, skip_unchanged=True)
+            self.assertEqual(keras_save.call_count, 1)
+
+            # identical model and index: the save is skipped entirely
+            model.save(out_dir, skip_unchanged=True)
+            self.assertEqual(keras_save.call_count, 1)
+
+            # the index moved but the model did not: only the index is
+            # rewritten
+            model.index_single(tf.constant([2, 2, 2], dtype="float32"), tf.constant(3))
+            model.save(out_dir, skip_unchanged=True)
+            self.assertEqual(keras_save.call_count, 1)
+
+            # a weight change forces a full model write
+            weights = model.get_weights()
+            weights[0] = weights[0] + 1.0
+            model.set_weights(weights)
+            model.save(out_dir, skip_unchanged=True)
+            self.assertEqual(keras_save.call_count, 2)
+
+            # so does a new destination
+            model.save(other_dir, skip_unchanged=True)
+            self.assertEqual(keras_save.call_count, 3)
+
     def test_index_single(self):
         """Unit Test for issues #161 & #162"""
         inputs = tf.keras.layers.Input(shape=(3,))
@@ -1,6 +1,8 @@
+import pickle
+
 import numpy as np
 
-from tensorflow_similarity.search.linear import LinearSearch
+from tensorflow_similarity.search.linear import _PICKLE5_MAGIC, LinearSearch
 
 
 def test_index_match():
@@ -100,6 +102,49 @@ def test_index_save(tmp_path):
     assert list(idxs3) == [0, 1, 3]
 
 
+def test_save_writes_out_of_band_format(tmp_path):
+    target = np.array([1, 1, 2], dtype="float32")
+    embs = np.array([[1, 1, 3], [3, 1, 2]], dtype="float32")
+
+    search_index = LinearSearch("cosine", 3)
+    search_index.batch_add(embs, [0, 1], normalize=False)
+    search_index.save(tmp_path)
+
+    # the file carries the out-of-band buffer magic
+    with open(tmp_path / "index.pickle", "rb") as f:
+        assert f.read(len(_PICKLE5_MAGIC)) == _PICKLE5_MAGIC
+
+    search_index2 = LinearSearch("cosine", 3)
+    search_index2.load(tmp_path)
+
+    idxs, dists = search_index2.lookup(target, k=2, normalize=False)
+    assert len(dists) == 2
+    assert list(idxs) == [0, 1]
+
+    # the reloaded index accepts new additions
+    search_index2.add(target, 5, normalize=False)
+    idxs3, dists3 = search_index2.lookup(target, k=3, normalize=False)
+    assert len(dists3) == 3
+    assert 5 in list(idxs3)
+
+
+def test_load_legacy_pickle_format(tmp_path):
+    target = np.array([1, 1, 2], dtype="float32")
+    embs = np.array([[1, 1, 3], [3, 1, 2]], dtype="float32")
+
+    # index written before the out-of-band buffer format: a plain pickle
+    # stream without the magic prefix.
+    with open(tmp_path / "index.pickle", "wb") as f:
+        pickle.dump(([embs[0], embs[1]], [0, 1]), f)
+
+    search_index = LinearSearch("cosine", 3)
+    search_index.load(tmp_path)
+
+    idxs, dists = search_index.lookup(target, k=2, normalize=False)
+    assert len(dists) == 2
+    assert list(idxs) == [0, 1]
+
+
 def test_batch_vs_single(tmp_path):
     num_targets = 10
     index_size = 100
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 from tensorflow_similarity.stores.memory import MemoryStore
@@ -62,6 +64,98 @@ def test_batch_add():
         assert np.array_equal(dt, data[idx])
 
 
+def test_save_and_reload_quantized_int8(tmp_path):
+    num_rows = 8
+    embs = np.random.random((num_rows, 16)).astype("float32")
+
+    kv_store = MemoryStore()
+    kv_store.batch_add(embs, list(range(num_rows)), [None] * num_rows)
+    kv_store.save(str(tmp_path), quantize="int8")
+
+    reloaded_store = MemoryStore()
+    reloaded_store.load(tmp_path)
+
+    assert reloaded_store.size() == num_rows
+    for idx in range(num_rows):
+        emb, lbl, _ = reloaded_store.get(idx)
+        assert emb.dtype == np.float32
+        # the error of symmetric per-row quantization is bounded by one
+        # quantization step.
+        assert np.allclose(emb, embs[idx], atol=np.abs(embs[idx]).max() / 127)
+        assert lbl == idx
+
+
+def test_save_and_reload_quantized_fp16(tmp_path):
+    num_rows = 8
+    embs = np.random.random((num_rows, 16)).astype("float32")
+
+    kv_store = MemoryStore()
+    kv_store.batch_add(embs, list(range(num_rows)), [None] * num_rows)
+    kv_store.save(str(tmp_path), quantize="fp16")
+
+    reloaded_store = MemoryStore()
+    reloaded_store.load(tmp_path)
+
+    assert reloaded_store.size() == num_rows
+    for idx in range(num_rows):
+        emb, lbl, _ = reloaded_store.get(idx)
+        assert emb.dtype == np.float32
+        assert np.allclose(emb, embs[idx], atol=1e-3)
+        assert lbl == idx
+
+
+def test_save_unknown_compression_codec(tmp_path):
+    kv_store = MemoryStore()
+    kv_store.add([0.1, 0.2], 1, None)
+    try:
+        kv_store.save(str(tmp_path), compression="lz4")
+        raise AssertionError("expected a ValueError for the unknown codec")
+    except ValueError:
+        pass
+
+
+def test_save_unknown_quantize_mode(tmp_path):
+    kv_store = MemoryStore()
+    kv_store.add([0.1, 0.2], 1, None)
+    try:
+        kv_store.save(str(tmp_path), quantize="int4")
+        raise AssertionError("expected a ValueError for the unknown mode")
+    except ValueError:
+        pass
+
+
+def test_mmap_backing_grow_and_reset(tmp_path):
+    kv_store = MemoryStore(backing="mmap", mmap_dir=str(tmp_path))
+
+    # enough rows to cross the initial capacity and force the doubling
+    # growth path a couple of times.
+    num_rows = 3000
+    embs = np.random.random((num_rows, 4)).astype("float32")
+    lbls = list(range(num_rows))
+    kv_store.batch_add(embs, lbls, [None] * num_rows)
+
+    assert kv_store.size() == num_rows
+    for idx in (0, 1024, num_rows - 1):
+        emb, lbl, _ = kv_store.get(idx)
+        assert np.array_equal(emb, embs[idx])
+        assert lbl == idx
+
+    backing_file = kv_store._emb_path
+    assert backing_file is not None
+    assert os.path.exists(backing_file)
+
+    # reset drops the records and unlinks the backing file
+    kv_store.reset()
+    assert kv_store.size() == 0
+    assert not os.path.exists(backing_file)
+
+    # the store stays usable after a reset
+    kv_store.add(embs[0], 1, None)
+    assert kv_store.size() == 1
+    emb, lbl, _ = kv_store.get(0)
+    assert np.array_equal(emb, embs[0])
+
+
 def test_save_and_reload(tmp_path):
     records = [[[0.1, 0.2], 1, [0, 0, 0]], [[0.2, 0.3], 2, [0, 0, 0]]]
 